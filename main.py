@@ -1,28 +1,41 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyreadstat
 import rdata
 import os
+import warnings
+
+# curly quotation marks and apostrophes replaced with straight apostrophes by select_columns
+_QUOTE_TRANS = str.maketrans({'\u201c': "'", '\u201d': "'", '\u2019': "'"})
+
+# answers treated as non-responses by kitchen_sink_prompt (lower case)
+_NON_RESPONSES = {'refused', 'refused to answer', 'not applicable', "don't know", 'do not know', 'no contact'}
 
 def read_file_as_dataframe(file_path: str) -> pd.DataFrame:
-	"""
-	Convert the raw survey data and read as pandas dataframe
+  """
+  Convert the raw survey data and read as pandas dataframe
+  CSV and TSV files are parsed with the pyarrow engine, falling back to the default parser for files it cannot read
   
   Parameters:
     filepath (str): The path to the survey data file.
 
   Returns:
     pd.DataFrame: The survey data.
-	"""
+  """
 
   # detect file type
   _, file_extension = os.path.splitext(file_path)
 
-  if file_extension.lower() == '.csv':
-    df = pd.read_csv(file_path)
-  elif file_extension.lower() == ".tsv":
-    df = pd.read_csv(file_path, sep="\t")
+  if file_extension.lower() in ['.csv', '.tsv']:
+    sep = "\t" if file_extension.lower() == ".tsv" else ","
+    try:
+      df = pd.read_csv(file_path, sep=sep, engine="pyarrow")
+    except ValueError:
+      df = pd.read_csv(file_path, sep=sep)
   elif file_extension.lower() in ['.xls', '.xlsx']:
+    warnings.warn("Reading Excel files is much slower than reading CSV files; consider exporting the survey data to CSV", stacklevel=2)
     df = pd.read_excel(file_path)
   elif file_extension.lower() == '.rdata':
     df = rdata.read_rda(file_path)
@@ -48,21 +61,37 @@ def select_columns(raw_data: pd.DataFrame, columns_demo: str, columns_resp: str)
     pd.DataFrame: The survey data with selected columns
   """
 
-  # create ID column for each respondent
-  raw_data['ID_'] = range(1, len(raw_data) + 1)
-
   # create column vector from column id strings
   columns = columns_demo.split(", ") + columns_resp.split(", ")
-  columns.insert(0, 'ID_')
 
-  # select columns
-  df = raw_data[columns]
+  # select columns by position into a new frame, keeping repeated names, and start it with an ID column for each respondent
+  # raw_data itself is left unchanged
+  df = raw_data.iloc[:, raw_data.columns.get_indexer_for(columns)]
+  df.insert(0, 'ID_', np.arange(1, len(raw_data) + 1, dtype=np.int32))
 
   # clean curly quotation marks and apostrophes
-  df = df.replace({'“': "'", '”': "'", '’': "'"}, regex=True)
+  df = df.apply(_straighten_quotes)
 
   return df
 
+def _straighten_quotes(column: pd.Series) -> pd.Series:
+  """
+  Replace curly quotation marks and apostrophes in the string values of a column with straight apostrophes, using a single str.translate pass per value
+
+  Parameters:
+    column (pd.Series): A column of the survey data selected in select_columns
+
+  Returns:
+    pd.Series: The column with its quotation marks cleaned; non-string values and columns that are neither object nor string dtype are left as they are
+  """
+
+  if pd.api.types.is_object_dtype(column):
+    return column.map(lambda value: value.translate(_QUOTE_TRANS) if isinstance(value, str) else value)
+  # string columns (including string[pyarrow]) keep their dtype and missing values
+  if isinstance(column.dtype, pd.StringDtype):
+    return column.str.translate(_QUOTE_TRANS)
+  return column
+
 def kitchen_sink_prompt(df: pd.DataFrame, columns_demo: str, columns_resp: str, question_text: list) -> pd.DataFrame:
   """
   Create prompts for asking substantive questions to LLMs using the returned dataframe from either afrobarometer_second_person_base or afrobarometer_third_person_base
@@ -77,19 +106,27 @@ def kitchen_sink_prompt(df: pd.DataFrame, columns_demo: str, columns_resp: str,
     pd.DataFrame: The final survey data for LLM application
   """
 
-  # make a response level variable for each substantive question
+  # make a response level text for each substantive question
   columns_resp = columns_resp.split(", ")
-  for col in columns_resp:
+  if len(question_text) != len(columns_resp):
+    raise ValueError("question_text must have the same number of items as columns_resp")
+  levels = np.empty(len(columns_resp), dtype=object)
+  for i, col in enumerate(columns_resp):
     column = df[col]
     # avoid error for selecting more than a single column
     if isinstance(column, pd.DataFrame):
       column = column.iloc[:, 0]
-    # filter out don't knows and the like
-    mask = ~column.str.contains('refused|not applicable|don\'t know|no contact|do not know', case=False, na=False)
-    # apply the mask, drop duplicates, sort and then concatenate with a semicolon
-    unique_values = column[mask].dropna().unique()
+    # drop duplicates, filter out don't knows and the like, sort and then concatenate with a semicolon
+    # the filter only needs to look at the distinct answers, not at every row
+    unique_values = [value for value in column.dropna().unique()
+                     if not any(non_response in value.lower() for non_response in _NON_RESPONSES)]
     unique_values.sort()
-    df[f'response_{col}'] = '; '.join(unique_values)
+    levels[i] = '; '.join(unique_values)
+
+  # store the base prompt as a categorical, so that the melt repeats an integer code per question rather than a copy of each respondent's text
+  # the column is replaced on a shallow copy, so the caller's frame keeps its own demo_base
+  df = df.copy(deep=False)
+  df['demo_base'] = df['demo_base'].astype('category')
 
   # make a row for each question (pivot_longer)
   df = pd.melt(df,
@@ -98,12 +135,32 @@ def kitchen_sink_prompt(df: pd.DataFrame, columns_demo: str, columns_resp: str,
                var_name='Question',
                value_name='Response')
 
-  df['Text'] = np.select([df['Question'] == q for q in columns_resp], question_text, default="")
+  # code each row's question once as a category, so that its text and response levels are gathered by integer position
+  # the returned Question column keeps the question names as plain strings
+  # a question listed more than once is one category, and takes its text from its first listing
+  questions = list(dict.fromkeys(columns_resp))
+  question_codes = pd.Categorical(df['Question'], categories=questions).codes
+  positions = np.array([columns_resp.index(question) for question in questions])[question_codes]
+
+  # attach the question text by indexing with the position of each row's question
+  df['Text'] = np.asarray(question_text, dtype=object)[positions]
 
   # create prompt texts from question text and response levels
-  df['Response_level'] = df.apply(lambda row: row[f"response_{row['Question']}"] if f"response_{row['Question']}" in row else 'N/A', axis=1)
-  df['Prompt'] = df.apply(lambda row: f"{row['demo_base']} '{row['Text']}' from the following responses: '{row['Response_level']}'", axis=1)
-  df = df.drop(columns=['Text', *df.filter(regex='response_Q').columns])
+  # pick each row's response levels by the position of its question
+  df['Response_level'] = levels[positions]
+  # the prompt is joined by a single Arrow kernel like demo_base; a missing demo_base leaves the prompt missing
+  # each respondent's base prompt is taken from the categories by its code, without expanding the categorical to Python strings
+  demo_base = df['demo_base'].array
+  base_text = pc.take(pa.array(demo_base.categories, type=pa.string()), pa.array(demo_base.codes, mask=demo_base.codes < 0))
+  prompt = pc.binary_join_element_wise(base_text,
+                                       " '", pa.array(df['Text'], type=pa.string()),
+                                       "' from the following responses: '", pa.array(df['Response_level'], type=pa.string()),
+                                       "'",
+                                       "")
+  df['Prompt'] = pd.Series(prompt, index=df.index, dtype='string[pyarrow]')
+  # the returned base prompt is a string column again, built from the texts already taken for the prompt
+  df['demo_base'] = pd.Series(base_text, index=df.index, dtype='string[pyarrow]')
+  df = df.drop(columns=['Text'])
 
   # Select specific columns (assuming you listed all columns you need explicitly)
   columns_demo = columns_demo.split(", ")
@@ -112,12 +169,29 @@ def kitchen_sink_prompt(df: pd.DataFrame, columns_demo: str, columns_resp: str,
   df = df[columns_demo]
 
   # Filtering rows based on a condition
-  df = df[~df['Response'].isin(['Not applicable', 'Not Applicable', 'Refused to Answer',
-                                'No contact', 'Don\'t Know', 'Don\'t know', 'Refused', 'Refused to answer',
-                                'Do not know'])]
+  # non-responses are matched case-insensitively, looking at each distinct answer once
+  non_responses = [value for value in df['Response'].unique() if isinstance(value, str) and value.lower() in _NON_RESPONSES]
+  df = df[~df['Response'].isin(non_responses)]
 
   return df
 
+def _lookup_labels(column: pd.Series, choices: dict) -> np.ndarray:
+  """
+  Translate the labels of a survey variable into prompt texts by looking each category up once and gathering the texts by the integer category codes
+
+  Parameters:
+    column (pd.Series): A categorical (or object) survey variable
+    choices (dict): The prompt text for each label; labels that are missing or not in the dict get an empty string
+
+  Returns:
+    np.ndarray: The prompt text for each row
+  """
+
+  categorical = pd.Categorical(column)
+  texts = np.array([choices.get(label, "") for label in categorical.categories] + [""], dtype=object)
+  # missing values have code -1 and pick the trailing empty string
+  return texts[categorical.codes]
+
 def afrobarometer_second_person_base(df: pd.DataFrame) -> pd.DataFrame:
   """
   Reorganise demographic variables from the afrobarometer data (Ghana round 9) and create the base for second-person ("You are") prompts using the dataframe returned from select_columns
@@ -131,96 +205,94 @@ def afrobarometer_second_person_base(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame: The survey data prepared for prompt creation (goes to kitchen_sink_prompt)
   """
 
+  # look up each compared variable once as a Categorical, so that comparisons against labels run on its integer codes
+  q90f, q90g, q89a, q96 = (pd.Categorical(df[col]) for col in ['Q90F', 'Q90G', 'Q89A', 'Q96'])
+
+  # variables decided by a single column are looked up once per category and gathered by integer code
+  # the others are assembled into an empty object array by writing every choice only to the rows it applies to
   # employment
-  # conditions are order dependent
-  empl_condlist = [df['Q93A'] == 'No (not looking)',
-                   df['Q93A'] == 'No (looking)',
-                   df['Q93A'] == 'Yes, part time',
-                   df['Q93A'] == 'Yes, full time']
-  empl_choicelist = ["You are unemployed and not looking for a job.",
-                     "You are unemployed and looking for a job.",
-                     "You have a part-time job.",
-                     "You have a full-time job."]
-  df['empl'] = np.select(empl_condlist, empl_choicelist, default="")
+  df['empl'] = _lookup_labels(df['Q93A'], {'No (not looking)': "You are unemployed and not looking for a job.",
+                                           'No (looking)': "You are unemployed and looking for a job.",
+                                           'Yes, part time': "You have a part-time job.",
+                                           'Yes, full time': "You have a full-time job."})
 
   # electricity
-  elec_condlist = [df['Q92A'] == 'No',
-                   df['Q92A'] == 'Yes']
-  elec_choicelist = ["You don't live in a home with electricity connection.",
-                     "You live in a home with electricity connection."]
-  df['elec'] = np.select(elec_condlist, elec_choicelist, default="")
+  df['elec'] = _lookup_labels(df['Q92A'], {'No': "You don't live in a home with electricity connection.",
+                                           'Yes': "You live in a home with electricity connection."})
 
   # mobile phone
-  mobile_condlist = [(df['Q90F'] == 'Yes (personally owns)') & (df['Q90G'] == 'No (Does not have internet access)'),
-                     (df['Q90F'] == 'Yes (personally owns)') & (df['Q90G'] == 'Yes (Have internet)'),
-                     df['Q90F'] == 'Yes (personally owns)',
-                     df['Q90F'] == 'Someone else in household owns',
-                     df['Q90F'] == 'No, no one in the household owns']
-  mobile_choicelist = ["You personally own a mobile phone but your phone doesn't have an Internet access.",
-                       "You personally own a mobile phone and your phone has an Internet access.",
-                       "You personally own a mobile phone.",
-                       "You don't personally own a mobile phone but someone else in the household owns a mobile phone.",
-                       "No one in your household owns a mobile phone."]
-  df['mobile'] = np.select(mobile_condlist, mobile_choicelist, default="")
+  # conditions are order dependent
+  mobile = np.full(len(df), "", dtype=object)
+  owns = q90f == 'Yes (personally owns)'
+  no_internet = owns & (q90g == 'No (Does not have internet access)')
+  internet = owns & (q90g == 'Yes (Have internet)')
+  mobile[no_internet] = "You personally own a mobile phone but your phone doesn't have an Internet access."
+  mobile[internet] = "You personally own a mobile phone and your phone has an Internet access."
+  mobile[owns & ~no_internet & ~internet] = "You personally own a mobile phone."
+  mobile[q90f == 'Someone else in household owns'] = "You don't personally own a mobile phone but someone else in the household owns a mobile phone."
+  mobile[q90f == 'No, no one in the household owns'] = "No one in your household owns a mobile phone."
+  df['mobile'] = mobile
 
   # nearby health clinic
-  clinic_condlist = [df['EA_FAC_D'] == 'No',
-                     df['EA_FAC_D'] == 'Yes']
-  clinic_choicelist = ["There's no health clinic near home.",
-                       "There's a health clinic near home."]
-  df['clinic'] = np.select(clinic_condlist, clinic_choicelist, default="")
+  df['clinic'] = _lookup_labels(df['EA_FAC_D'], {'No': "There's no health clinic near home.",
+                                                 'Yes': "There's a health clinic near home."})
 
   # party
-  party_condlist = [(df['Q89A'] == "Yes (feels close to a party)") & (~df['Q89B'].isin(['Refused', "Don't know"])),
-                    df['Q89A'] == "Yes (feels close to a party)",
-                    df['Q89A'] == "No (does NOT feel close to ANY party)",
-                    df['Q89A'] == "Don't know"]
-  party_choicelist = [("You feel close to " + df['Q89B'] + "."),
-                      "You have a political party you feel close.",
-                      "You don't feel close to any particular party.",
-                      "You don't know if you feel close to any particular party."]
-  df['party'] = np.select(party_condlist, party_choicelist, default="")
+  # conditions are order dependent
+  party = np.full(len(df), "", dtype=object)
+  close = q89a == "Yes (feels close to a party)"
+  named = close & ~df['Q89B'].isin(['Refused', "Don't know"]).values
+  party[named] = ("You feel close to " + df.loc[named, 'Q89B'] + ".").values
+  party[close & ~named] = "You have a political party you feel close."
+  party[q89a == "No (does NOT feel close to ANY party)"] = "You don't feel close to any particular party."
+  party[q89a == "Don't know"] = "You don't know if you feel close to any particular party."
+  df['party'] = party
 
   # voting intention
-  vote_condlist = [df['Q96']  == "Would not vote",
-                   df['Q96'] == "Don't know",
-                   df['Q96'] == "Refused to answer",
-                   df['Q96'] != "Refused to answer"]
-  vote_choicelist = ["You would not vote if a presidential election is held tomorrow.",
-                     "You don't know who you would vote for if a presidential election is held tomorrow.",
-                     "",
-                     ("The political party of your preferred presidential candidate is " + df['Q96'] + ".")]
-  df['vote'] = np.select(vote_condlist, vote_choicelist, default="")
+  vote = np.full(len(df), "", dtype=object)
+  candidate = ~df['Q96'].isin(["Would not vote", "Don't know", "Refused to answer"]).values
+  vote[q96 == "Would not vote"] = "You would not vote if a presidential election is held tomorrow."
+  vote[q96 == "Don't know"] = "You don't know who you would vote for if a presidential election is held tomorrow."
+  vote[candidate] = ("The political party of your preferred presidential candidate is " + df.loc[candidate, 'Q96'] + ".").values
+  df['vote'] = vote
 
   # create base prompt for each row
-  df['demo_base'] = ("You are Ghanaian and you live in a " + df['URBRUR'] +
-                     " area in the " + df['REGION'] +
-                     " region of Ghana. You are " + df['Q1'].astype(int).astype(str) +
-                     " years old. You are a " + df['Q100'] +
-                     " and your race is " + df['Q101'] +
-                     ". The primary language you speak at home is " + df['Q2'] +
-                     ". Your highest level of education is " + df['Q94'] +
-                     ". Your religion is " + df['Q95'] +
-                     ". You identify as " + df['Q84A'] + ". " +
-                     df['empl'] +
-                     " Your last occupation is " + df['Q93B'] +
-                     ". Your household's main source of water is " + df['Q91A'] +
-                     ". " + df['elec'] +
-                     " " + df['mobile'] +
-                     " " + df['clinic'] +
-                     " You feel " + df['Q4B'] +
-                     " about your present living condition. " + df['party'] +
-                     " " + df['vote'] +
-                     " Answer the question")
+  # all pieces are joined by a single Arrow kernel; a missing value in any column leaves the prompt missing
+  text = {col: pa.array(df[col], type=pa.string()) for col in ['URBRUR', 'REGION', 'Q100', 'Q101', 'Q2', 'Q94', 'Q95', 'Q84A',
+                                                               'empl', 'Q93B', 'Q91A', 'elec', 'mobile', 'clinic', 'Q4B', 'party', 'vote']}
+  # age is parsed once as a number, truncated to whole years like astype(int) and formatted by Arrow
+  # it is converted from a NumPy array, so a missing age raises like astype(int) rather than leaving the prompt missing
+  age = pc.cast(pa.array(np.trunc(pd.to_numeric(df['Q1']).to_numpy()), type=pa.int32()), pa.string())
+  demo_base = pc.binary_join_element_wise("You are Ghanaian and you live in a ", text['URBRUR'],
+                                          " area in the ", text['REGION'],
+                                          " region of Ghana. You are ", age,
+                                          " years old. You are a ", text['Q100'],
+                                          " and your race is ", text['Q101'],
+                                          ". The primary language you speak at home is ", text['Q2'],
+                                          ". Your highest level of education is ", text['Q94'],
+                                          ". Your religion is ", text['Q95'],
+                                          ". You identify as ", text['Q84A'], ". ",
+                                          text['empl'],
+                                          " Your last occupation is ", text['Q93B'],
+                                          ". Your household's main source of water is ", text['Q91A'],
+                                          ". ", text['elec'],
+                                          " ", text['mobile'],
+                                          " ", text['clinic'],
+                                          " You feel ", text['Q4B'],
+                                          " about your present living condition. ", text['party'],
+                                          " ", text['vote'],
+                                          " Answer the question",
+                                          "")
+  df['demo_base'] = pd.Series(demo_base, index=df.index, dtype='string[pyarrow]')
 
   # reconstruct priority variable
-  conditions = [df['Q45PT1'].isin(['Health', 'AIDS', 'COVID-19', 'Sickness / Disease']),
-                df['Q45PT1'].isin(['Nothing/ no problems', 'Refused', "Don't know"]),
-                ~df['Q45PT1'].isin(['Nothing/ no problems', 'Refused', "Don't know"])]
-  choices = ["Health-related issues such as health, sickness/disease, COVID-19 and AIDS",
-             df['Q45PT1'],
-             "Issues other than health such as the economy, food/agriculture, infrastructure, public services, country's governance and climate"]
-  df['Q45PT1'] = np.select(conditions, choices, default=df['Q45PT1'])
+  # non-answers (nothing, refused, don't know) are kept as they are
+  priority = df['Q45PT1'].to_numpy(dtype=object, copy=True)
+  health = df['Q45PT1'].isin(['Health', 'AIDS', 'COVID-19', 'Sickness / Disease']).values
+  other = ~health & ~df['Q45PT1'].isin(['Nothing/ no problems', 'Refused', "Don't know"]).values
+  priority[health] = "Health-related issues such as health, sickness/disease, COVID-19 and AIDS"
+  priority[other] = "Issues other than health such as the economy, food/agriculture, infrastructure, public services, country's governance and climate"
+  df['Q45PT1'] = priority
 
   return df
 
@@ -236,101 +308,125 @@ def afrobarometer_third_person_base(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame: The survey data prepared for prompt creation (goes to kitchen_sink_prompt)
   """
 
-  gender = [df['Q100'] == 'Woman',
-            df['Q100'] == 'Man']
-  df['pronoun_nom'] = np.select(gender, ["She", "He"], default = "")
-  df['pronoun_pos'] = np.select(gender, ["Her", "His"], default = "")
+  # look up each compared variable once as a Categorical, so that comparisons against labels run on its integer codes
+  q100, q93a, q92a, q90f, q90g, ea_fac_d, q89a, q96 = (pd.Categorical(df[col]) for col in ['Q100', 'Q93A', 'Q92A', 'Q90F', 'Q90G', 'EA_FAC_D', 'Q89A', 'Q96'])
+
+  # pronouns
+  pronoun_nom = np.full(len(df), "", dtype=object)
+  pronoun_pos = np.full(len(df), "", dtype=object)
+  pronoun_nom[q100 == 'Woman'] = "She"
+  pronoun_nom[q100 == 'Man'] = "He"
+  pronoun_pos[q100 == 'Woman'] = "Her"
+  pronoun_pos[q100 == 'Man'] = "His"
+  df['pronoun_nom'] = pronoun_nom
+  df['pronoun_pos'] = pronoun_pos
 
+  # each variable is assembled into an empty object array by writing every choice only to the rows it applies to
   # employment
-  # conditions are order dependent
-  empl_condlist = [df['Q93A'] == 'No (not looking)',
-                   df['Q93A'] == 'No (looking)',
-                   df['Q93A'] == 'Yes, part time',
-                   df['Q93A'] == 'Yes, full time']
-  empl_choicelist = [(df['pronoun_nom'] + " is unemployed and not looking for a job."),
-                     (df['pronoun_nom'] + " is unemployed and looking for a job."),
-                     (df['pronoun_nom'] + " has a part-time job."),
-                     (df['pronoun_nom'] + " has a full-time job.")]
-  df['empl'] = np.select(empl_condlist, empl_choicelist, default="")
+  empl = np.full(len(df), "", dtype=object)
+  unemployed = q93a == 'No (not looking)'
+  looking = q93a == 'No (looking)'
+  part_time = q93a == 'Yes, part time'
+  full_time = q93a == 'Yes, full time'
+  empl[unemployed] = pronoun_nom[unemployed] + " is unemployed and not looking for a job."
+  empl[looking] = pronoun_nom[looking] + " is unemployed and looking for a job."
+  empl[part_time] = pronoun_nom[part_time] + " has a part-time job."
+  empl[full_time] = pronoun_nom[full_time] + " has a full-time job."
+  df['empl'] = empl
 
   # electricity
-  elec_condlist = [df['Q92A'] == 'No',
-                   df['Q92A'] == 'Yes']
-  elec_choicelist = [(df['pronoun_nom'] + " doesn't live in a home with electricity connection."),
-                     (df['pronoun_nom'] + " lives in a home with electricity connection.")]
-  df['elec'] = np.select(elec_condlist, elec_choicelist, default="")
+  elec = np.full(len(df), "", dtype=object)
+  no_elec = q92a == 'No'
+  has_elec = q92a == 'Yes'
+  elec[no_elec] = pronoun_nom[no_elec] + " doesn't live in a home with electricity connection."
+  elec[has_elec] = pronoun_nom[has_elec] + " lives in a home with electricity connection."
+  df['elec'] = elec
 
   # mobile phone
-  mobile_condlist = [(df['Q90F'] == 'Yes (personally owns)') & (df['Q90G'] == 'No (Does not have internet access)'),
-                     (df['Q90F'] == 'Yes (personally owns)') & (df['Q90G'] == 'Yes (Have internet)'),
-                     df['Q90F'] == 'Yes (personally owns)',
-                     df['Q90F'] == 'Someone else in household owns',
-                     df['Q90F'] == 'No, no one in the household owns']
-  mobile_choicelist = [(df['pronoun_nom'] + " personally owns a mobile phone but " + df['pronoun_pos'] + " phone doesn't have an Internet access."),
-                       (df['pronoun_nom'] + " personally owns a mobile phone and " + df['pronoun_pos'] + " phone has an Internet access."),
-                       (df['pronoun_nom'] + " personally owns a mobile phone."),
-                       (df['pronoun_nom'] + " doesn't personally own a mobile phone but someone else in the household owns a mobile phone."),
-                       ("No one in "  + df['pronoun_pos'] +  " household owns a mobile phone.")]
-  df['mobile'] = np.select(mobile_condlist, mobile_choicelist, default="")
+  # conditions are order dependent
+  mobile = np.full(len(df), "", dtype=object)
+  owns = q90f == 'Yes (personally owns)'
+  no_internet = owns & (q90g == 'No (Does not have internet access)')
+  internet = owns & (q90g == 'Yes (Have internet)')
+  owns_only = owns & ~no_internet & ~internet
+  household = q90f == 'Someone else in household owns'
+  no_one = q90f == 'No, no one in the household owns'
+  mobile[no_internet] = pronoun_nom[no_internet] + " personally owns a mobile phone but " + pronoun_pos[no_internet] + " phone doesn't have an Internet access."
+  mobile[internet] = pronoun_nom[internet] + " personally owns a mobile phone and " + pronoun_pos[internet] + " phone has an Internet access."
+  mobile[owns_only] = pronoun_nom[owns_only] + " personally owns a mobile phone."
+  mobile[household] = pronoun_nom[household] + " doesn't personally own a mobile phone but someone else in the household owns a mobile phone."
+  mobile[no_one] = "No one in " + pronoun_pos[no_one] + " household owns a mobile phone."
+  df['mobile'] = mobile
 
   # nearby health clinic
-  clinic_condlist = [df['EA_FAC_D'] == 'No',
-                     df['EA_FAC_D'] == 'Yes']
-  clinic_choicelist = [("There's no health clinic near " + df['pronoun_pos'] + " home."),
-                       ("There's a health clinic near " + df['pronoun_pos'] + " home.")]
-  df['clinic'] = np.select(clinic_condlist, clinic_choicelist, default="")
+  clinic = np.full(len(df), "", dtype=object)
+  no_clinic = ea_fac_d == 'No'
+  has_clinic = ea_fac_d == 'Yes'
+  clinic[no_clinic] = "There's no health clinic near " + pronoun_pos[no_clinic] + " home."
+  clinic[has_clinic] = "There's a health clinic near " + pronoun_pos[has_clinic] + " home."
+  df['clinic'] = clinic
 
   # party
-  party_condlist = [(df['Q89A'] == "Yes (feels close to a party)") & (~df['Q89B'].isin(['Refused', "Don't know"])),
-                    df['Q89A'] == "Yes (feels close to a party)",
-                    df['Q89A'] == "No (does NOT feel close to ANY party)",
-                    df['Q89A'] == "Don't know"]
-  party_choicelist = [(df['pronoun_nom'] + " feels close to " + df['Q89B'] + "."),
-                      (df['pronoun_nom'] + " has a political party " + df['pronoun_nom'] + " feels close."),
-                      (df['pronoun_nom'] + " doesn't feel close to any particular party."),
-                      (df['pronoun_nom'] + " doesn't know if " + df['pronoun_nom'] + " feels close to any particular party.")]
-  df['party'] = np.select(party_condlist, party_choicelist, default="")
+  # conditions are order dependent
+  party = np.full(len(df), "", dtype=object)
+  close = q89a == "Yes (feels close to a party)"
+  named = close & ~df['Q89B'].isin(['Refused', "Don't know"]).values
+  unnamed = close & ~named
+  not_close = q89a == "No (does NOT feel close to ANY party)"
+  dont_know = q89a == "Don't know"
+  party[named] = (pronoun_nom[named] + " feels close to " + df.loc[named, 'Q89B'] + ".").values
+  party[unnamed] = pronoun_nom[unnamed] + " has a political party " + pronoun_nom[unnamed] + " feels close."
+  party[not_close] = pronoun_nom[not_close] + " doesn't feel close to any particular party."
+  party[dont_know] = pronoun_nom[dont_know] + " doesn't know if " + pronoun_nom[dont_know] + " feels close to any particular party."
+  df['party'] = party
 
   # voting intention
-  vote_condlist = [df['Q96']  == "Would not vote",
-                   df['Q96'] == "Don't know",
-                   df['Q96'] == "Refused to answer",
-                   df['Q96'] != "Refused to answer"]
-  vote_choicelist = [(df['pronoun_nom'] + " would not vote if a presidential election is held tomorrow."),
-                     (df['pronoun_nom'] + " doesn't know who " + df['pronoun_nom'] + " would vote for if a presidential election is held tomorrow."),
-                     "",
-                     ("The political party of " + df['pronoun_pos'] + " preferred presidential candidate is " + df['Q96'] + ".")]
-  df['vote'] = np.select(vote_condlist, vote_choicelist, default="")
+  vote = np.full(len(df), "", dtype=object)
+  no_vote = q96 == "Would not vote"
+  undecided = q96 == "Don't know"
+  candidate = ~df['Q96'].isin(["Would not vote", "Don't know", "Refused to answer"]).values
+  vote[no_vote] = pronoun_nom[no_vote] + " would not vote if a presidential election is held tomorrow."
+  vote[undecided] = pronoun_nom[undecided] + " doesn't know who " + pronoun_nom[undecided] + " would vote for if a presidential election is held tomorrow."
+  vote[candidate] = ("The political party of " + pronoun_pos[candidate] + " preferred presidential candidate is " + df.loc[candidate, 'Q96'] + ".").values
+  df['vote'] = vote
 
   # create base prompt for each row
-  df['demo_base'] = ("Consider the following person: A Ghanaian who lives in a " + df['URBRUR'] +
-                     " area in the " + df['REGION'] +
-                     " region of Ghana. " + df['pronoun_nom'] + " is " + df['Q1'].astype(int).astype(str) +
-                     " years old. " + df['pronoun_nom'] + " is a " + df['Q100'] +
-                     " and " + df['pronoun_pos'] + " race is " + df['Q101'] +
-                     ". The primary language " + df['pronoun_nom'] + " speaks at home is " + df['Q2'] +
-                     ". " + df['pronoun_pos'] + " highest level of education is " + df['Q94'] +
-                     ". " + df['pronoun_pos'] + " religion is " + df['Q95'] +
-                     ". " + df['pronoun_nom'] + " identifies as " + df['Q84A'] + ". " +
-                     df['empl'] +
-                     " " + df['pronoun_pos'] + " last occupation is " + df['Q93B'] +
-                     ". " + df['pronoun_pos'] + " household's main source of water is " + df['Q91A'] +
-                     ". " + df['elec'] +
-                     " " + df['mobile'] +
-                     " " + df['clinic'] +
-                     " " + df['pronoun_nom'] + " feels " + df['Q4B'] +
-                     " about " + df['pronoun_pos'] + " present living condition. " + df['party'] +
-                     " " + df['vote'] +
-                     " How do you think " + df['pronoun_nom'] + " would answer the question")
+  # all pieces are joined by a single Arrow kernel; a missing value in any column leaves the prompt missing
+  text = {col: pa.array(df[col], type=pa.string()) for col in ['URBRUR', 'REGION', 'pronoun_nom', 'pronoun_pos', 'Q100', 'Q101', 'Q2', 'Q94', 'Q95', 'Q84A',
+                                                               'empl', 'Q93B', 'Q91A', 'elec', 'mobile', 'clinic', 'Q4B', 'party', 'vote']}
+  # age is parsed once as a number, truncated to whole years like astype(int) and formatted by Arrow
+  # it is converted from a NumPy array, so a missing age raises like astype(int) rather than leaving the prompt missing
+  age = pc.cast(pa.array(np.trunc(pd.to_numeric(df['Q1']).to_numpy()), type=pa.int32()), pa.string())
+  demo_base = pc.binary_join_element_wise("Consider the following person: A Ghanaian who lives in a ", text['URBRUR'],
+                                          " area in the ", text['REGION'],
+                                          " region of Ghana. ", text['pronoun_nom'], " is ", age,
+                                          " years old. ", text['pronoun_nom'], " is a ", text['Q100'],
+                                          " and ", text['pronoun_pos'], " race is ", text['Q101'],
+                                          ". The primary language ", text['pronoun_nom'], " speaks at home is ", text['Q2'],
+                                          ". ", text['pronoun_pos'], " highest level of education is ", text['Q94'],
+                                          ". ", text['pronoun_pos'], " religion is ", text['Q95'],
+                                          ". ", text['pronoun_nom'], " identifies as ", text['Q84A'], ". ",
+                                          text['empl'],
+                                          " ", text['pronoun_pos'], " last occupation is ", text['Q93B'],
+                                          ". ", text['pronoun_pos'], " household's main source of water is ", text['Q91A'],
+                                          ". ", text['elec'],
+                                          " ", text['mobile'],
+                                          " ", text['clinic'],
+                                          " ", text['pronoun_nom'], " feels ", text['Q4B'],
+                                          " about ", text['pronoun_pos'], " present living condition. ", text['party'],
+                                          " ", text['vote'],
+                                          " How do you think ", text['pronoun_nom'], " would answer the question",
+                                          "")
+  df['demo_base'] = pd.Series(demo_base, index=df.index, dtype='string[pyarrow]')
 
   # reconstruct priority variable
-  conditions = [df['Q45PT1'].isin(['Health', 'AIDS', 'COVID-19', 'Sickness / Disease']),
-                df['Q45PT1'].isin(['Nothing/ no problems', 'Refused', "Don't know"]),
-                ~df['Q45PT1'].isin(['Nothing/ no problems', 'Refused', "Don't know"])]
-  choices = ["Health-related issues such as health, sickness/disease, COVID-19 and AIDS",
-             df['Q45PT1'],
-             "Issues other than health such as the economy, food/agriculture, infrastructure, public services, country's governance and climate"]
-  df['Q45PT1'] = np.select(conditions, choices, default=df['Q45PT1'])
+  # non-answers (nothing, refused, don't know) are kept as they are
+  priority = df['Q45PT1'].to_numpy(dtype=object, copy=True)
+  health = df['Q45PT1'].isin(['Health', 'AIDS', 'COVID-19', 'Sickness / Disease']).values
+  other = ~health & ~df['Q45PT1'].isin(['Nothing/ no problems', 'Refused', "Don't know"]).values
+  priority[health] = "Health-related issues such as health, sickness/disease, COVID-19 and AIDS"
+  priority[other] = "Issues other than health such as the economy, food/agriculture, infrastructure, public services, country's governance and climate"
+  df['Q45PT1'] = priority
 
   return df
 
@@ -386,95 +482,100 @@ def synthetic_interview(df: pd.DataFrame) -> pd.DataFrame:
   """
 
   # subset the data so that it only include subjects/interviewees with full response from selected questions
-  df = df[df['Question'].isin(["Q6C", "Q41A", "Q41D", "Q9A"])]
-  respondent_counts = df.groupby('ID_')['Question'].nunique()
-  complete_respondents = respondent_counts[respondent_counts == df['Question'].nunique()].index
-  df = df[df['ID_'].isin(complete_respondents)]
+  selected_questions = ["Q6C", "Q41A", "Q41D", "Q9A"]
+  df = df[df['Question'].isin(selected_questions)]
+  respondent_counts = df.groupby('ID_', sort=False)['Question'].nunique()
+  complete_respondents = respondent_counts.index[respondent_counts == df['Question'].nunique()]
+
+  # keep one row of demographics per complete respondent
+  # demographics are constant within an ID and there is one answer per ID per question
+  demo = df[['ID_', 'Q1', 'Q100', 'Q101', 'Q94', 'Q8', 'Q4A']].drop_duplicates('ID_').set_index('ID_').loc[complete_respondents]
 
   # recategorise some variables
-  edu_condlist = [df["Q94"].isin(["No formal schooling", "Informal schooling only (including Koranic schooling)"]),
-                  df["Q94"].isin(["Some primary schooling", "Primary school completed"]),
-                  df["Q94"].isin(["Intermediate school or Some secondary school / high school", "Secondary school / high school completed"]),
-                  df["Q94"] == "Post-secondary qualifications, other than university e.g. a diploma or degree from a polytechnic or college",
-                  ~df["Q94"].isin(["Don't know", "Refused"])]
+  edu_condlist = [demo["Q94"].isin(["No formal schooling", "Informal schooling only (including Koranic schooling)"]),
+                  demo["Q94"].isin(["Some primary schooling", "Primary school completed"]),
+                  demo["Q94"].isin(["Intermediate school or Some secondary school / high school", "Secondary school / high school completed"]),
+                  demo["Q94"] == "Post-secondary qualifications, other than university e.g. a diploma or degree from a polytechnic or college",
+                  ~demo["Q94"].isin(["Don't know", "Refused"])]
   edu_recode = ["No formal schooling", "Primary school", "Secondary", "Diploma", "University"]
-  df["education"] = np.select(edu_condlist, edu_recode, default = np.nan)
+  demo["education"] = np.select(edu_condlist, edu_recode, default = np.nan)
 
-  race_condlist = [df["Q101"] == "Black / African",
-                   df["Q101"] == "Coloured / Mixed race"]
+  race_condlist = [demo["Q101"] == "Black / African",
+                   demo["Q101"] == "Coloured / Mixed race"]
   race_recode = ["Black", "Coloured"]
-  df["race"] = np.select(race_condlist, race_recode, default = np.nan)
-
-  # reorganise data
-  unique_ids = df['ID_'].unique()
-  new_prompt_file = []
-
-  for check_now in unique_ids:
-    # Filter data for the current ID
-    val_set = df[df['ID_'] == check_now]
-
-    # Extract unique answers - assuming one answer per ID per question
-    answer_age = val_set['Q1'].unique()[0].astype(int).astype(str) #Q1
-    answer_gender = val_set['Q100'].unique()[0] #Q100
-    answer_race = val_set['race'].unique()[0] #Q101
-    answer_education = val_set['education'].unique()[0] #Q94
-    answer_political_conv = val_set['Q8'].unique()[0] #Q8
-    answer_econ_assess = val_set['Q4A'].unique()[0] #Q4A
-    answer_freedom = val_set[val_set['Question'] == 'Q9A']['Response'].iloc[0] #Q9A
-    answer_medicine = val_set[val_set['Question'] == 'Q6C']['Response'].iloc[0] #Q6C
-    answer_clinic = val_set[val_set['Question'] == 'Q41A']['Response'].iloc[0] #Q41A
-    answer_health_trust = val_set[val_set['Question'] == 'Q41D']['Response'].iloc[0] #Q41D
-
-    # Build text prompts
-    QA_age = f"Interviewer: What is your age in years?\nMe: {answer_age}."
-    QA_gender = f"Interviewer: What is your gender? Please respond with: Man or Woman.\nMe: {answer_gender}."
-    QA_race = f"Interviewer: What is your race? Please respond with: Black or Coloured.\nMe: {answer_race}."
-    QA_education = f"Interviewer: What is your highest level of education? Please respond with: university, diploma, secondary, primary school or no formal schooling.\nMe: {answer_education}."
-    QA_political_conv = f"Interviewer: When you get together with your friends or family, how often would you say you discuss political matters? Please respond with: Occasionally, Never or Frequently.\nMe: {answer_political_conv}."
-    QA_econ_assess = f"Interviewer: In general, how would you describe: The present economic condition of this country? Please respond with: Very good, Fairly good, Neither good nor bad, Fairly bad or Very bad.\nMe: {answer_econ_assess}."
-    QA_freedom = f"Interviewer: In this country, how free are you: to say what you think? Please respond with: Completely free, Somewhat free, Not very free or Not at all free.\nMe: {answer_freedom}."
-    QA_medicine = f"Interviewer: Over the past year, how often, if ever, have you or anyone in your family gone without: Medicines or medical treatment? Please respond with: Always, Many times, Several times, Just once or twice or Never.\nMe: {answer_medicine}."
-    QA_clinic = f"Interviewer: In the past 12 months, have you had contact with a public clinic or hospital? Please respond with: Yes or No.\nMe: {answer_clinic}."
-    QA_health_trust = f"Interviewer: In general, when dealing with health workers and clinic or hospital staff, how much do you feel you can trust them? Please respond with: A lot, A little bit, Somewhat, No contact or Not at all.\nMe: {answer_health_trust}."
-
-    text_health_trust = f"{QA_age}\n{QA_gender}\n{QA_race}\n{QA_education}\n{QA_political_conv}\n{QA_econ_assess}\n{QA_freedom}\n{QA_medicine}\n{QA_clinic}\n{question_health_trust}"
-    text_clinic = f"{QA_age}\n{QA_gender}\n{QA_race}\n{QA_education}\n{QA_political_conv}\n{QA_econ_assess}\n{QA_freedom}\n{QA_medicine}\n{QA_health_trust}\n{question_clinic}"
-    text_medicine = f"{QA_age}\n{QA_gender}\n{QA_race}\n{QA_education}\n{QA_political_conv}\n{QA_econ_assess}\n{QA_freedom}\n{QA_clinic}\n{QA_health_trust}\n{question_medicine}"
-    text_freedom = f"{QA_age}\n{QA_gender}\n{QA_race}\n{QA_education}\n{QA_political_conv}\n{QA_econ_assess}\n{QA_medicine}\n{QA_clinic}\n{QA_health_trust}\n{question_freedom}"
-    text_econ_assess = f"{QA_age}\n{QA_gender}\n{QA_race}\n{QA_education}\n{QA_political_conv}\n{QA_freedom}\n{QA_medicine}\n{QA_clinic}\n{QA_health_trust}\n{question_econ_assess}"
-    text_political_conv = f"{QA_age}\n{QA_gender}\n{QA_race}\n{QA_education}\n{QA_econ_assess}\n{QA_freedom}\n{QA_medicine}\n{QA_clinic}\n{QA_health_trust}\n{question_political_conv}"
-    text_education = f"{QA_age}\n{QA_gender}\n{QA_race}\n{QA_political_conv}\n{QA_econ_assess}\n{QA_freedom}\n{QA_medicine}\n{QA_clinic}\n{QA_health_trust}\n{question_education}"
-    text_race = f"{QA_age}\n{QA_gender}\n{QA_education}\n{QA_political_conv}\n{QA_econ_assess}\n{QA_freedom}\n{QA_medicine}\n{QA_clinic}\n{QA_health_trust}\n{question_race}"
-    text_gender = f"{QA_age}\n{QA_race}\n{QA_education}\n{QA_political_conv}\n{QA_econ_assess}\n{QA_freedom}\n{QA_medicine}\n{QA_clinic}\n{QA_health_trust}\n{question_gender}"
-    text_age = f"{QA_gender}\n{QA_race}\n{QA_education}\n{QA_political_conv}\n{QA_econ_assess}\n{QA_freedom}\n{QA_medicine}\n{QA_clinic}\n{QA_health_trust}\n{question_age}"
-
-    # Append the result to the list
-    new_prompt_file.append({
-        'ID': check_now,
-        'text_health_trust': text_health_trust,
-        'text_clinic': text_clinic,
-        'text_medicine': text_medicine,
-        'text_freedom': text_freedom,
-        'text_econ_assess': text_econ_assess,
-        'text_political_conv': text_political_conv,
-        'text_education': text_education,
-        'text_race': text_race,
-        'text_gender': text_gender,
-        'text_age': text_age,
-        'answer_health_trust': answer_health_trust,
-        'answer_clinic': answer_clinic,
-        'answer_medicine': answer_medicine,
-        'answer_freedom': answer_freedom,
-        'answer_econ_assess': answer_econ_assess,
-        'answer_political_conv': answer_political_conv,
-        'answer_education': answer_education,
-        'answer_race': answer_race,
-        'answer_gender': answer_gender,
-        'answer_age': answer_age
-
-    })
-
-  # Convert the list to a DataFrame for easier manipulation or export
-  new_prompt_df = pd.DataFrame(new_prompt_file)
+  demo["race"] = np.select(race_condlist, race_recode, default = np.nan)
+
+  # reorganise data into one row per respondent with a column for each selected question
+  # every selected question gets a column, even when none of them has answers left
+  # a question listed more than once keeps its first answer per respondent
+  resp_wide = df.drop_duplicates(['ID_', 'Question']).pivot(index='ID_', columns='Question', values='Response').reindex(columns=selected_questions)
+  merged = demo.join(resp_wide)
+
+  # Extract answers
+  answer_age = merged['Q1'].astype(int).astype(str) #Q1
+  answer_gender = merged['Q100'] #Q100
+  answer_race = merged['race'] #Q101
+  answer_education = merged['education'] #Q94
+  answer_political_conv = merged['Q8'] #Q8
+  answer_econ_assess = merged['Q4A'] #Q4A
+  answer_freedom = merged['Q9A'] #Q9A
+  answer_medicine = merged['Q6C'] #Q6C
+  answer_clinic = merged['Q41A'] #Q41A
+  answer_health_trust = merged['Q41D'] #Q41D
+
+  # Build text prompts
+  QA_age = "Interviewer: What is your age in years?\nMe: " + answer_age + "."
+  QA_gender = "Interviewer: What is your gender? Please respond with: Man or Woman.\nMe: " + answer_gender.astype(str) + "."
+  QA_race = "Interviewer: What is your race? Please respond with: Black or Coloured.\nMe: " + answer_race.astype(str) + "."
+  QA_education = "Interviewer: What is your highest level of education? Please respond with: university, diploma, secondary, primary school or no formal schooling.\nMe: " + answer_education.astype(str) + "."
+  QA_political_conv = "Interviewer: When you get together with your friends or family, how often would you say you discuss political matters? Please respond with: Occasionally, Never or Frequently.\nMe: " + answer_political_conv.astype(str) + "."
+  QA_econ_assess = "Interviewer: In general, how would you describe: The present economic condition of this country? Please respond with: Very good, Fairly good, Neither good nor bad, Fairly bad or Very bad.\nMe: " + answer_econ_assess.astype(str) + "."
+  QA_freedom = "Interviewer: In this country, how free are you: to say what you think? Please respond with: Completely free, Somewhat free, Not very free or Not at all free.\nMe: " + answer_freedom.astype(str) + "."
+  QA_medicine = "Interviewer: Over the past year, how often, if ever, have you or anyone in your family gone without: Medicines or medical treatment? Please respond with: Always, Many times, Several times, Just once or twice or Never.\nMe: " + answer_medicine.astype(str) + "."
+  QA_clinic = "Interviewer: In the past 12 months, have you had contact with a public clinic or hospital? Please respond with: Yes or No.\nMe: " + answer_clinic.astype(str) + "."
+  QA_health_trust = "Interviewer: In general, when dealing with health workers and clinic or hospital staff, how much do you feel you can trust them? Please respond with: A lot, A little bit, Somewhat, No contact or Not at all.\nMe: " + answer_health_trust.astype(str) + "."
+
+  # each text leaves out the answer to its own question and ends by asking it
+  # the answers before and after the left-out one are joined once and shared between the texts
+  parts = [QA_age, QA_gender, QA_race, QA_education, QA_political_conv, QA_econ_assess, QA_freedom, QA_medicine, QA_clinic, QA_health_trust]
+  questions = [question_age, question_gender, question_race, question_education, question_political_conv, question_econ_assess, question_freedom, question_medicine, question_clinic, question_health_trust]
+  heads = [parts[0]]
+  for qa in parts[1:-1]:
+    heads.append(heads[-1] + "\n" + qa)
+  tails = [parts[-1]]
+  for qa in reversed(parts[1:-1]):
+    tails.insert(0, qa + "\n" + tails[0])
+  texts = [tails[0] + "\n" + questions[0]]
+  texts += [heads[i - 1] + "\n" + tails[i] + "\n" + questions[i] for i in range(1, len(parts) - 1)]
+  texts.append(heads[-1] + "\n" + questions[-1])
+  text_age, text_gender, text_race, text_education, text_political_conv, text_econ_assess, text_freedom, text_medicine, text_clinic, text_health_trust = texts
+
+  # Collect the columns in a DataFrame for easier manipulation or export
+  new_prompt_columns = {
+      'ID': merged.index,
+      'text_health_trust': text_health_trust,
+      'text_clinic': text_clinic,
+      'text_medicine': text_medicine,
+      'text_freedom': text_freedom,
+      'text_econ_assess': text_econ_assess,
+      'text_political_conv': text_political_conv,
+      'text_education': text_education,
+      'text_race': text_race,
+      'text_gender': text_gender,
+      'text_age': text_age,
+      'answer_health_trust': answer_health_trust,
+      'answer_clinic': answer_clinic,
+      'answer_medicine': answer_medicine,
+      'answer_freedom': answer_freedom,
+      'answer_econ_assess': answer_econ_assess,
+      'answer_political_conv': answer_political_conv,
+      'answer_education': answer_education,
+      'answer_race': answer_race,
+      'answer_gender': answer_gender,
+      'answer_age': answer_age
+
+  }
+  # hand over the underlying arrays so the frame adopts them without aligning on the respondent index
+  new_prompt_df = pd.DataFrame({name: values.array for name, values in new_prompt_columns.items()}, copy=False)
 
   return new_prompt_df
\ No newline at end of file